@@ -2,18 +2,27 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry, ConfigType
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import Event, HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
+from .event_log import EventRecorder
 from .graph import MultiroomGraph
 
 _PLATFORMS: list[Platform] = [
     Platform.MEDIA_PLAYER,
 ]
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
+START_RECORDING_SCHEMA = vol.Schema({vol.Optional("filename"): cv.string})
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -26,10 +35,41 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    if recorder := hass.data[DOMAIN].recorder:
+        await recorder.async_flush()
     return await hass.config_entries.async_unload_platforms(entry, _PLATFORMS)
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up Multiroom AV basic configuration."""
-    hass.data[DOMAIN] = MultiroomGraph(hass)
+    graph = MultiroomGraph(hass)
+    hass.data[DOMAIN] = graph
+
+    async def start_recording(call: ServiceCall) -> None:
+        filename = call.data.get(
+            "filename", f"multiroom_events_{dt_util.now():%Y%m%d_%H%M%S}.jsonl.gz"
+        )
+        path = hass.config.path(filename)
+        if Path(filename).name != filename or filename.startswith("."):
+            raise ServiceValidationError(
+                f"{filename} must be a file name in the configuration directory"
+            )
+        recorder = EventRecorder(hass, path)
+        try:
+            await recorder.async_start(graph)
+        except FileExistsError as err:
+            raise HomeAssistantError(f"{path} already exists") from err
+        await stop_recording(call)
+        graph.recorder = recorder
+
+    async def stop_recording(call: ServiceCall | Event) -> None:
+        if graph.recorder:
+            await graph.recorder.async_stop()
+            graph.recorder = None
+
+    async_register_admin_service(
+        hass, DOMAIN, "start_recording", start_recording, START_RECORDING_SCHEMA
+    )
+    async_register_admin_service(hass, DOMAIN, "stop_recording", stop_recording)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, stop_recording)
     return True
@@ -0,0 +1,166 @@
+"""Record the state changes seen by Multiroom AV for offline replay."""
+
+import asyncio
+import gzip
+import json
+import logging
+import time
+import zlib
+from datetime import timedelta
+
+from homeassistant.core import callback
+from homeassistant.helpers.event import (
+    async_track_state_change_event,
+    async_track_time_interval,
+)
+
+from .const import DOMAIN
+
+logger = logging.getLogger(__name__)
+
+RECORDED_ATTRIBUTES = ("source", "friendly_name")
+FLUSH_EVERY = 500
+FLUSH_INTERVAL = timedelta(seconds=5)
+
+
+def _compact_state(state):
+    if state is None:
+        return None
+    rtn = {"state": state.state}
+    for attribute in RECORDED_ATTRIBUTES:
+        if (value := state.attributes.get(attribute)) is not None:
+            rtn[attribute] = value
+    return rtn
+
+
+def _dumps(obj):
+    return json.dumps(obj, separators=(",", ":")) + "\n"
+
+
+class EventRecorder:
+    """Append state change events for the routing graph and rooms to a file.
+
+    The file is gzipped JSON lines. The first line holds the players config
+    entries, the rooms and the initial states; every following line is one
+    event with its time in seconds since recording started. An existing file
+    is never overwritten. Events are written every ``FLUSH_INTERVAL`` or every
+    ``FLUSH_EVERY`` events, whichever comes first.
+
+    The tracked entities, entries and rooms are a snapshot taken at start;
+    players or rooms set up later are not recorded.
+    """
+
+    __slots__ = (
+        "hass",
+        "path",
+        "_start",
+        "_buffer",
+        "_lock",
+        "_unsub",
+        "_unsub_interval",
+        "_flush_pending",
+    )
+
+    def __init__(self, hass, path):
+        self.hass = hass
+        self.path = path
+        self._start = None
+        self._buffer = []
+        self._lock = asyncio.Lock()
+        self._unsub = None
+        self._unsub_interval = None
+        self._flush_pending = False
+
+    async def async_start(self, graph):
+        entity_ids = set(graph.graph.nodes)
+        rooms = []
+        for sink in graph.sinks:
+            entity_ids.update(sink.players)
+            rooms.append(
+                {
+                    "area": sink.device_info["name"],
+                    "audio": sink.audio_players,
+                    "video": sink.video_players,
+                }
+            )
+        header = {
+            "entries": [
+                dict(entry.data)
+                for entry in self.hass.config_entries.async_entries(DOMAIN)
+                if entry.data["type"] == "players"
+            ],
+            "rooms": rooms,
+            "states": {
+                entity_id: _compact_state(self.hass.states.get(entity_id))
+                for entity_id in sorted(entity_ids)
+            },
+        }
+        self._start = time.monotonic()
+        await self.hass.async_add_executor_job(self._write, "xb", [_dumps(header)])
+        self._unsub = async_track_state_change_event(
+            self.hass, sorted(entity_ids), self._record
+        )
+        self._unsub_interval = async_track_time_interval(
+            self.hass, self._flush_soon, FLUSH_INTERVAL
+        )
+        logger.info("recording %d entities to %s", len(entity_ids), self.path)
+
+    async def async_stop(self):
+        if self._unsub:
+            self._unsub()
+            self._unsub = None
+        if self._unsub_interval:
+            self._unsub_interval()
+            self._unsub_interval = None
+        await self.async_flush()
+        logger.info("stopped recording to %s", self.path)
+
+    @callback
+    def _record(self, event):
+        self._buffer.append(
+            _dumps(
+                {
+                    "t": round(time.monotonic() - self._start, 6),
+                    "entity_id": event.data["entity_id"],
+                    "old": _compact_state(event.data["old_state"]),
+                    "new": _compact_state(event.data["new_state"]),
+                }
+            )
+        )
+        if len(self._buffer) >= FLUSH_EVERY:
+            self._flush_soon()
+
+    @callback
+    def _flush_soon(self, now=None):
+        if self._buffer and not self._flush_pending:
+            self._flush_pending = True
+            self.hass.async_create_task(self.async_flush())
+
+    async def async_flush(self):
+        async with self._lock:
+            self._flush_pending = False
+            lines, self._buffer = self._buffer, []
+            if lines:
+                await self.hass.async_add_executor_job(self._write, "ab", lines)
+
+    def _write(self, mode, lines):
+        with gzip.open(self.path, mode) as file:
+            file.write("".join(lines).encode())
+
+
+def load_event_log(path):
+    """Return the header and the list of events from a recorded file.
+
+    A file cut short by a crash is read up to its last complete event.
+    """
+    events = []
+    with gzip.open(path, "rt") as file:
+        header = json.loads(file.readline())
+        try:
+            for line in file:
+                events.append(json.loads(line))
+        except (EOFError, gzip.BadGzipFile, zlib.error, json.JSONDecodeError):
+            logger.warning(
+                "%s is truncated, read %d complete events", path, len(events)
+            )
+    return header, events
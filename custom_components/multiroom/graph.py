@@ -12,16 +12,22 @@ logger = logging.getLogger(__name__)
 
 
 class MultiroomGraph:
-    sinks = []
+    __slots__ = ("hass", "graph", "sinks", "revision", "recorder")
 
     def __init__(self, hass):
         self.hass = hass
         self.graph = nx.DiGraph()
+        self.sinks = []
+        # Bumped whenever the routing graph changes so sinks can tell when
+        # their cached source maps are stale.
+        self.revision = 0
+        self.recorder = None
 
     async def async_setup_entry(self, entry):
         for player in entry.data["players"]:
             for source, source_player in entry.data["sources"].items():
                 self.graph.add_edge(source_player, player, source=source)
+        self.revision += 1
 
         nx.write_network_text(self.graph)
         for sink in self.sinks:
@@ -38,7 +44,7 @@ class MultiroomGraph:
             self.sinks.append(sink)
             sink.async_on_remove(
                 async_track_state_change_event(
-                    self.hass, self.sources(), sink.async_schedule_update_ha_state
+                    self.hass, self.sources(), sink.on_update
                 )
             )
 
@@ -109,9 +115,9 @@ class MultiroomGraph:
         changed_source = (new and old) and not new_source == old.attributes.get("source")
         if turned_off or changed_source:
             if turned_off:
-                print(f"{player} turned off")
+                logger.debug("%s turned off", player)
             elif changed_source:
-                print(f"{player} change source to {new_source}")
+                logger.debug("%s changed source to %s", player, new_source)
             ancestors = nx.ancestors(self.graph, player)
             for ancestor in ancestors:
                 state = self.hass.states.get(ancestor)
@@ -120,7 +126,7 @@ class MultiroomGraph:
                         continue
                     active_out_edges = [edge for edge in self.graph.out_edges(ancestor, data=True) if edge[2].get("active")]
                     if not active_out_edges:
-                        print(f"turning off {ancestor}")
+                        logger.debug("turning off %s", ancestor)
                         await self.hass.services.async_call(
                             MEDIA_PLAYER_DOMAIN,
                             "turn_off",
@@ -54,9 +54,6 @@ class RoomPlayer(MediaPlayerEntity):
     _attr_has_entity_name = True
     _attr_name = None
     _attr_should_poll = False
-    source_map = {}
-    sound_map = {}
-    desired_source = None
 
     def __init__(self, config, audio_only=False):
         self.audio_players = config.data["audio"]
@@ -76,15 +73,13 @@ class RoomPlayer(MediaPlayerEntity):
         if len(self.audio_players) > 1:
             self._attr_supported_features |= MediaPlayerEntityFeature.SELECT_SOUND_MODE
         self.selected_audio_player = self.audio_players[0]
+        self.desired_source = None
+        self._source_map = {}
+        self._source_map_key = None
+        self._sound_map = {}
+        self._sound_map_complete = False
 
     async def async_added_to_hass(self):
-        config_entries = self.hass.config_entries.async_entries(DOMAIN)
-        for entry in config_entries:
-            if entry.data["type"] == "players" and set(self.players) & set(
-                entry.data["players"]
-            ):
-                self.source_map.update(entry.data["sources"])
-
         self.async_on_remove(
             async_track_state_change_event(self.hass, self.players, self.on_update)
         )
@@ -155,7 +150,7 @@ class RoomPlayer(MediaPlayerEntity):
     @property
     def source(self):
         if self.desired_source:
-            print(f"des is {self.desired_source}")
+            logger.debug("desired source is %s", self.desired_source)
             return self.desired_source
         if self.source_entity:
             return self.hass.states.get(self.source_entity).attributes.get(
@@ -176,20 +171,37 @@ class RoomPlayer(MediaPlayerEntity):
             state = self.hass.states.get(self.source_entity)
             return state
 
+    def _name_map(self, entity_ids):
+        """Map friendly names to entity ids, noting whether every state exists."""
+        states = [self.hass.states.get(entity_id) for entity_id in entity_ids]
+        name_map = {
+            state.attributes.get("friendly_name"): state.entity_id
+            for state in states
+            if state
+        }
+        return name_map, all(states)
+
+    @property
+    def source_map(self):
+        """Friendly name to entity id for the sources reachable from this room.
+
+        Rebuilt only when the routing graph or the selected players change,
+        when a source had no state yet on the previous build, or when
+        ``on_update`` sees a player or source change its name.
+        """
+        graph = self.hass.data[DOMAIN]
+        key = (graph.revision, tuple(self.used_players))
+        if key != self._source_map_key:
+            source_ids = {
+                source for player in key[1] for source in graph.sources(player)
+            }
+            self._source_map, complete = self._name_map(source_ids)
+            self._source_map_key = key if complete else None
+        return self._source_map
+
     @property
     def source_list(self):
-        source_ids = {
-            source
-            for player in self.used_players
-            for source in self.hass.data[DOMAIN].sources(player)
-        }
-        states = [self.hass.states.get(source) for source in source_ids]
-        states = [state for state in states if state]
-        self.source_map = {
-            state.attributes.get("friendly_name"): state.entity_id for state in states
-        }
-        rtn = list(self.source_map.keys())
-        return rtn
+        return list(self.source_map)
 
     @property
     def sound_mode(self):
@@ -198,15 +210,18 @@ class RoomPlayer(MediaPlayerEntity):
             if state:
                 return state.attributes.get("friendly_name")
 
+    @property
+    def sound_map(self):
+        """Friendly name to entity id for this room's audio players."""
+        if not self._sound_map_complete:
+            self._sound_map, self._sound_map_complete = self._name_map(
+                self.audio_players
+            )
+        return self._sound_map
+
     @property
     def sound_mode_list(self):
-        states = [self.hass.states.get(player) for player in self.audio_players]
-        states = [state for state in states if state]
-        self.sound_map = {
-            state.attributes.get("friendly_name"): state.entity_id for state in states
-        }
-        rtn = list(self.sound_map.keys())
-        return rtn
+        return list(self.sound_map)
 
     @property
     def volume_level(self):
@@ -316,4 +331,11 @@ class RoomPlayer(MediaPlayerEntity):
             )
 
     async def on_update(self, update):
+        old = update.data["old_state"]
+        new = update.data["new_state"]
+        old_name = old.attributes.get("friendly_name") if old else None
+        new_name = new.attributes.get("friendly_name") if new else None
+        if old_name != new_name:
+            self._source_map_key = None
+            self._sound_map_complete = False
         self.async_schedule_update_ha_state(update)
@@ -0,0 +1,98 @@
+"""Memory benchmark for RoomPlayer source and sound maps.
+
+Builds a synthetic routing graph in which every room is fed by a fixed
+number of sources drawn from a shared pool, then creates the rooms and reads
+their source and sound mode lists as Home Assistant would on each state
+write. Only the room players and their maps are measured: the fake states,
+graph and configs are allocated before the first snapshot.
+
+Run from the repository root in a Home Assistant development environment:
+
+    python scripts/benchmark_memory.py
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.multiroom.const import DOMAIN  # noqa: E402
+from custom_components.multiroom.graph import MultiroomGraph  # noqa: E402
+from custom_components.multiroom.media_player import RoomPlayer  # noqa: E402
+from fakes import FakeStates  # noqa: E402
+
+
+def build_fixtures(n_rooms, n_sources, per_room):
+    hass = SimpleNamespace(states=FakeStates(), data={})
+    graph = MultiroomGraph(hass)
+    hass.data[DOMAIN] = graph
+
+    sources = [f"media_player.source_{i}" for i in range(n_sources)]
+    for i, source in enumerate(sources):
+        hass.states.set(source, "playing", friendly_name=f"Source {i}")
+
+    configs = []
+    for r in range(n_rooms):
+        audio = [f"media_player.room_{r}_speaker", f"media_player.room_{r}_soundbar"]
+        for player in audio:
+            hass.states.set(player, "on", friendly_name=player)
+        for i in range(per_room):
+            source = sources[(r * per_room + i) % n_sources]
+            graph.graph.add_edge(source, audio[0], source=f"Input {i}")
+        configs.append(SimpleNamespace(data={"area": f"room_{r}", "audio": audio}))
+    graph.revision += 1
+    return hass, configs
+
+
+def measure(n_rooms, n_sources, per_room, reads):
+    hass, configs = build_fixtures(n_rooms, n_sources, per_room)
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot().filter_traces(ignore)
+    rooms = []
+    for config in configs:
+        room = RoomPlayer(config)
+        room.hass = hass
+        rooms.append(room)
+    for room in rooms:
+        room.source_list
+        room.sound_mode_list
+    after = tracemalloc.take_snapshot().filter_traces(ignore)
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(reads):
+        for room in rooms:
+            room.source_list
+            room.sound_mode_list
+    elapsed = time.perf_counter() - start
+
+    retained = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return retained / n_rooms, elapsed / (n_rooms * reads) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rooms", type=int, nargs="+", default=[10, 100, 300])
+    parser.add_argument("--sources", type=int, nargs="+", default=[10, 100, 300])
+    parser.add_argument(
+        "--per-room", type=int, default=8, help="sources reachable from each room"
+    )
+    parser.add_argument("--reads", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'rooms':>6} {'sources':>8} {'B/room':>8} {'us/read':>8}")
+    for n_rooms in args.rooms:
+        for n_sources in args.sources:
+            per_room = min(args.per_room, n_sources)
+            size, read = measure(n_rooms, n_sources, per_room, args.reads)
+            print(f"{n_rooms:>6} {n_sources:>8} {size:>8.0f} {read:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
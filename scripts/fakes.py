@@ -0,0 +1,73 @@
+"""Minimal stand-ins for the parts of Home Assistant the benchmarks use."""
+
+import asyncio
+from collections import Counter
+from types import SimpleNamespace
+
+
+def fake_state(entity_id, state, **attributes):
+    return SimpleNamespace(entity_id=entity_id, state=state, attributes=attributes)
+
+
+class FakeStates:
+    def __init__(self):
+        self._states = {}
+
+    def set(self, entity_id, state, **attributes):
+        self._states[entity_id] = fake_state(entity_id, state, **attributes)
+
+    def remove(self, entity_id):
+        self._states.pop(entity_id, None)
+
+    def get(self, entity_id):
+        return self._states.get(entity_id)
+
+
+class FakeServices:
+    """Count service calls instead of executing them."""
+
+    def __init__(self):
+        self.calls = Counter()
+
+    async def async_call(self, domain, service, data, blocking=False):
+        self.calls[f"{domain}.{service}"] += 1
+
+
+class FakeStateTracker:
+    """Replacement for ``async_track_state_change_event``.
+
+    Coroutine listeners are scheduled as tasks and other listeners are called
+    inline, as Home Assistant does for callbacks.
+    """
+
+    def __init__(self):
+        self.listeners = {}
+
+    def __call__(self, hass, entity_ids, action):
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+        for entity_id in entity_ids:
+            self.listeners.setdefault(entity_id, []).append(action)
+
+        def unsubscribe():
+            for entity_id in entity_ids:
+                self.listeners[entity_id].remove(action)
+
+        return unsubscribe
+
+    def dispatch(self, event):
+        """Run the listeners for an event and return the scheduled tasks.
+
+        A callback that raises is returned as a failed future so that one
+        listener's error does not stop the others.
+        """
+        tasks = []
+        for action in list(self.listeners.get(event.data["entity_id"], [])):
+            try:
+                result = action(event)
+            except Exception as err:
+                result = asyncio.get_running_loop().create_future()
+                result.set_exception(err)
+            if result is not None and hasattr(result, "__await__"):
+                tasks.append(asyncio.ensure_future(result))
+        return tasks
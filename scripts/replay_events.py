@@ -0,0 +1,264 @@
+"""Replay a recorded Multiroom AV event stream against a fake service layer.
+
+Record a stream in Home Assistant with the ``multiroom.start_recording`` and
+``multiroom.stop_recording`` services, then run from the repository root in a
+Home Assistant development environment:
+
+    python scripts/replay_events.py multiroom_events.jsonl.gz --speed 10
+
+The graph and ``RoomPlayer`` instances are set up through the integration's
+own ``add_sinks``, ``async_added_to_hass`` and ``async_setup_entry``, so they
+register the same state listeners as in production. Rooms are added before the
+players entries unless ``--entries-first`` is given; the order changes which
+source listeners exist, as it does in Home Assistant.
+
+Events are dispatched at the recorded pace divided by ``--speed`` (0 replays
+as fast as possible). Coroutine listeners run as tasks and callbacks run
+inline, as in Home Assistant, but the tasks for one event are awaited before
+the next event is dispatched so that service calls and state writes can be
+attributed to it. Service calls are counted rather than executed, and every
+state write evaluates the room's attributes as Home Assistant would.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import logging
+import sys
+import time
+from pathlib import Path
+from statistics import mean
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.multiroom import graph as graph_module  # noqa: E402
+from custom_components.multiroom import media_player  # noqa: E402
+from custom_components.multiroom.const import DOMAIN  # noqa: E402
+from custom_components.multiroom.event_log import load_event_log  # noqa: E402
+from custom_components.multiroom.graph import MultiroomGraph  # noqa: E402
+from custom_components.multiroom.media_player import RoomPlayer  # noqa: E402
+from fakes import (  # noqa: E402
+    FakeServices,
+    FakeStates,
+    FakeStateTracker,
+    fake_state,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Stats:
+    def __init__(self, services):
+        self.services = services
+        self.writes = 0
+        self.errors = 0
+        self.calls_per_event = []
+        self.writes_per_event = []
+        self.handler_times = []
+        self.schedule_lag = []
+        self.loop_lag = []
+        self._calls_seen = 0
+        self._writes_seen = 0
+
+    def reset(self):
+        self.services.calls.clear()
+        self.writes = 0
+        self._calls_seen = 0
+        self._writes_seen = 0
+
+    def end_event(self, handler_time, schedule_lag):
+        calls = sum(self.services.calls.values())
+        self.calls_per_event.append(calls - self._calls_seen)
+        self.writes_per_event.append(self.writes - self._writes_seen)
+        self._calls_seen = calls
+        self._writes_seen = self.writes
+        self.handler_times.append(handler_time)
+        self.schedule_lag.append(schedule_lag)
+
+
+class ReplayRoomPlayer(RoomPlayer):
+    """Room player that counts state writes instead of writing them."""
+
+    def __init__(self, config, stats):
+        super().__init__(config)
+        self.stats = stats
+
+    def async_on_remove(self, func):
+        pass
+
+    def async_schedule_update_ha_state(self, force_refresh=False):
+        self.stats.writes += 1
+        self.state
+        self.source
+        self.source_list
+        self.sound_mode
+        self.sound_mode_list
+        self.volume_level
+        self.is_volume_muted
+        self.media_title
+        self.entity_picture
+        self.extra_state_attributes
+
+
+def _attributes(compact):
+    return {k: v for k, v in compact.items() if k != "state"}
+
+
+def _state(entity_id, compact):
+    if compact is None:
+        return None
+    return fake_state(entity_id, compact["state"], **_attributes(compact))
+
+
+def _set_state(states, entity_id, compact):
+    if compact is None:
+        states.remove(entity_id)
+    else:
+        states.set(entity_id, compact["state"], **_attributes(compact))
+
+
+async def build(header, entries_first):
+    """Set up the graph and rooms from a recording header.
+
+    ``async_track_state_change_event`` is patched in the integration modules
+    only while they register their listeners, and restored afterwards.
+    """
+    tracker = FakeStateTracker()
+    states = FakeStates()
+    services = FakeServices()
+    stats = Stats(services)
+    hass = SimpleNamespace(states=states, services=services, data={})
+    for entity_id, compact in header["states"].items():
+        _set_state(states, entity_id, compact)
+
+    graph = MultiroomGraph(hass)
+    hass.data[DOMAIN] = graph
+    entries = [SimpleNamespace(data=data) for data in header["entries"]]
+
+    async def add_rooms():
+        rooms = []
+        for room in header["rooms"]:
+            player = ReplayRoomPlayer(SimpleNamespace(data=room), stats)
+            player.hass = hass
+            await player.async_added_to_hass()
+            rooms.append(player)
+        graph.add_sinks(rooms)
+
+    async def add_entries():
+        for entry in entries:
+            await graph.async_setup_entry(entry)
+
+    with contextlib.ExitStack() as stack:
+        for module in (graph_module, media_player):
+            stack.enter_context(
+                mock.patch.object(module, "async_track_state_change_event", tracker)
+            )
+        stack.enter_context(contextlib.redirect_stdout(io.StringIO()))
+        if entries_first:
+            await add_entries()
+            await add_rooms()
+        else:
+            await add_rooms()
+            await add_entries()
+    stats.reset()
+    return hass, tracker, stats
+
+
+async def monitor(stats, interval, stop):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        stats.loop_lag.append(time.perf_counter() - start - interval)
+
+
+async def replay(path, speed, interval, entries_first):
+    header, events = load_event_log(path)
+    hass, tracker, stats = await build(header, entries_first)
+
+    stop = asyncio.Event()
+    monitor_task = asyncio.create_task(monitor(stats, interval, stop))
+    start = time.perf_counter()
+    for event in events:
+        target = start + event["t"] / speed if speed else time.perf_counter()
+        if (delay := target - time.perf_counter()) > 0:
+            await asyncio.sleep(delay)
+        else:
+            await asyncio.sleep(0)
+        schedule_lag = time.perf_counter() - target
+
+        entity_id = event["entity_id"]
+        _set_state(hass.states, entity_id, event["new"])
+        ha_event = SimpleNamespace(
+            data={
+                "entity_id": entity_id,
+                "old_state": _state(entity_id, event["old"]),
+                "new_state": hass.states.get(entity_id),
+            }
+        )
+
+        handler_start = time.perf_counter()
+        tasks = tracker.dispatch(ha_event)
+        for result in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(result, Exception):
+                stats.errors += 1
+                logger.debug("listener failed for %s: %r", entity_id, result)
+        stats.end_event(time.perf_counter() - handler_start, schedule_lag)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await monitor_task
+    return stats, len(events), elapsed
+
+
+def _summary(values, scale=1.0):
+    if not values:
+        return "n/a"
+    ordered = sorted(values)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return (
+        f"mean {mean(values) * scale:.3f}  p95 {p95 * scale:.3f}  "
+        f"max {ordered[-1] * scale:.3f}"
+    )
+
+
+def report(stats, n_events, elapsed):
+    print(f"events replayed:       {n_events} in {elapsed:.2f}s")
+    print(f"listener errors:       {stats.errors}")
+    print(f"event loop lag (ms):   {_summary(stats.loop_lag, 1000)}")
+    print(f"schedule lag (ms):     {_summary(stats.schedule_lag, 1000)}")
+    print(f"handler time (ms):     {_summary(stats.handler_times, 1000)}")
+    print(f"service calls / event: {_summary(stats.calls_per_event)}")
+    print(f"state writes / event:  {_summary(stats.writes_per_event)}")
+    for service, count in stats.services.calls.most_common():
+        print(f"  {service}: {count}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="recorded event file")
+    parser.add_argument(
+        "--speed", type=float, default=1.0, help="replay speed, 0 for no delay"
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.01,
+        help="event loop lag sampling interval in seconds",
+    )
+    parser.add_argument(
+        "--entries-first",
+        action="store_true",
+        help="set up the players entries before the rooms",
+    )
+    args = parser.parse_args()
+    report(
+        *asyncio.run(
+            replay(args.path, args.speed, args.interval, args.entries_first)
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()